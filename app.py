@@ -0,0 +1,325 @@
+# ============================================
+# PCOS Clinical Screening — Streamlit App
+# Single entrypoint serving the calibrated ensemble pipeline
+# exported by PCOS-Table_Data.ipynb.
+# Labels follow the notebook: 0 = PCOS (unhealthy), 1 = healthy.
+# ============================================
+
+import contextlib
+import functools
+import io
+
+import streamlit as st
+import numpy as np
+from sklearn.compose._column_transformer import _RemainderColsList  # noqa: F401  needed to unpickle the pipeline
+
+st.set_page_config(page_title="PCOS Clinical Screening", page_icon="🩺", layout="wide")
+
+# --- Global Config ---
+MODEL_PATH = "pcos_pipeline_v4_updated.pkl"
+SPINNER_MIN_ROWS = 100  # smaller inputs finish before a spinner is worth drawing
+
+# Feature order the pipeline was fit on; used only if the loaded model does
+# not expose feature_names_in_ (see model_columns).
+_FALLBACK_COLUMNS = (
+    "Age (yrs)", "Weight (Kg)", "Height(Cm)", "BMI", "Blood Group",
+    "Pulse rate(bpm)", "RR (breaths/min)", "Hb(g/dl)", "Cycle(R/I)",
+    "Cycle length(days)", "Marraige Status (Yrs)", "Pregnant(Y/N)",
+    "No. of abortions", "I   beta-HCG(mIU/mL)", "II    beta-HCG(mIU/mL)",
+    "FSH(mIU/mL)", "LH(mIU/mL)", "FSH/LH", "Hip(inch)", "Waist(inch)",
+    "Waist:Hip Ratio", "TSH (mIU/L)", "AMH(ng/mL)", "PRL(ng/mL)",
+    "Vit D3 (ng/mL)", "PRG(ng/mL)", "RBS(mg/dl)", "Weight gain(Y/N)",
+    "hair growth(Y/N)", "Skin darkening (Y/N)", "Hair loss(Y/N)",
+    "Pimples(Y/N)", "Fast food (Y/N)", "Reg.Exercise(Y/N)",
+    "BP _Systolic (mmHg)", "BP _Diastolic (mmHg)", "Follicle No. (L)",
+    "Follicle No. (R)", "Avg. F size (L) (mm)", "Avg. F size (R) (mm)",
+    "Endometrium (mm)",
+)
+
+# Columns the pipeline's ColumnTransformer routes through the one-hot
+# (categorical) branch; they must be passed as strings, not floats. Used only
+# if the loaded model's "cat" transformer can't be read (see model_text_columns).
+_FALLBACK_TEXT_COLUMNS = frozenset({"II    beta-HCG(mIU/mL)"})
+
+# Count-valued columns collected with integer widgets
+COL_IS_INT = frozenset({
+    "Age (yrs)", "Pulse rate(bpm)", "RR (breaths/min)", "No. of abortions",
+    "Follicle No. (L)", "Follicle No. (R)", "BP _Systolic (mmHg)",
+    "BP _Diastolic (mmHg)", "Cycle length(days)",
+})
+
+# Integer codes used for Blood Group in the training data
+BLOOD_GROUP_CODES = {
+    "A+": 11, "A-": 12, "B+": 13, "B-": 14,
+    "O+": 15, "O-": 16, "AB+": 17, "AB-": 18,
+}
+
+
+def _classify(col_name):
+    if col_name == "Blood Group":
+        return "blood"
+    if "(Y/N)" in col_name:
+        return "yn"
+    if "Cycle(R/I)" in col_name:
+        return "cycle"
+    if "beta-HCG" in col_name:
+        return "hcg"
+    if col_name in COL_IS_INT:
+        return "int"
+    return "num"
+
+
+# Initial widget state per column kind, seeded into st.session_state once
+KIND_DEFAULTS = {"yn": "No", "cycle": "Regular", "blood": "A+", "hcg": 1.99, "int": 0, "num": 0.0}
+
+
+@st.cache_resource
+def _column_tables(columns):
+    """COL_INDEX, COLUMN_KIND and DEFAULTS for `columns`.
+
+    Module scope re-executes on every Streamlit rerun, so the tables are cached
+    per process and each column is classified once per schema, not per rerun.
+    """
+    col_index = {name: i for i, name in enumerate(columns)}
+    column_kind = {name: _classify(name) for name in columns}
+    defaults = {name: KIND_DEFAULTS[column_kind[name]] for name in columns}
+    return col_index, column_kind, defaults
+
+
+def _set_columns(columns, text_columns=_FALLBACK_TEXT_COLUMNS):
+    """Point ALL_COLUMNS, TEXT_COLUMNS and the per-column lookup tables at `columns`."""
+    global ALL_COLUMNS, TEXT_COLUMNS, COL_INDEX, COLUMN_KIND, DEFAULTS
+    ALL_COLUMNS = tuple(columns)
+    TEXT_COLUMNS = frozenset(text_columns)
+    COL_INDEX, COLUMN_KIND, DEFAULTS = _column_tables(ALL_COLUMNS)
+
+
+def make_frame(arr):
+    """Wrap a (n, len(ALL_COLUMNS)) float32 array for the pipeline.
+
+    The pipeline was fit on a DataFrame (it checks feature_names_in_), so
+    the buffer is wrapped without copying and only TEXT_COLUMNS are replaced
+    by their string form.
+    """
+    import pandas as pd  # deferred: only needed once a prediction is made
+
+    df = pd.DataFrame(arr, columns=list(ALL_COLUMNS), copy=False)
+    for c in TEXT_COLUMNS:
+        if c in COL_INDEX:
+            # Match the CSV strings the encoder was fit on: "12", not "12.0"
+            df[c] = [np.format_float_positional(v, trim="-") for v in arr[:, COL_INDEX[c]]]
+    return df
+
+
+# ============ Model ============
+def model_columns(model):
+    """Feature order recorded on the fitted pipeline, else the fallback list."""
+    try:
+        return tuple(model.feature_names_in_)
+    except AttributeError:
+        return _FALLBACK_COLUMNS
+
+
+def model_text_columns(model):
+    """Columns the fitted ColumnTransformer sends to its "cat" branch, else the fallback."""
+    try:
+        if hasattr(model, "calibrated_classifiers_"):
+            model = model.calibrated_classifiers_[0].estimator
+        pre = model[0]  # first Pipeline step: the ColumnTransformer
+        return frozenset(next(cols for name, _, cols in pre.transformers_ if name == "cat"))
+    except (TypeError, AttributeError, IndexError, StopIteration):
+        return _FALLBACK_TEXT_COLUMNS
+
+
+def _pin_single_thread(est):
+    """Pin est and every fitted sub-estimator to a single thread.
+
+    Walks CalibratedClassifierCV -> Pipeline -> VotingClassifier members, so the
+    n_jobs=-1 the ensemble was trained with doesn't spin up a thread pool
+    for each 1-row predict. CatBoost has no n_jobs and its predict_proba takes
+    its own thread_count=-1 keyword (the constructor param isn't consulted),
+    so VotingClassifier's bare predict_proba(X) call is bound to one thread.
+    """
+    if hasattr(est, "get_all_params"):  # CatBoost
+        est.predict_proba = functools.partial(est.predict_proba, thread_count=1)
+    else:
+        try:
+            if "n_jobs" in est.get_params(deep=False):
+                est.set_params(n_jobs=1)
+        except AttributeError:
+            pass  # not an estimator (e.g. "passthrough") or no n_jobs
+    children = [cc.estimator for cc in getattr(est, "calibrated_classifiers_", ())]
+    children += [step for _, step in getattr(est, "steps", ())]
+    children += list(getattr(est, "estimators_", ()))
+    for child in children:
+        _pin_single_thread(child)
+
+
+@st.cache_resource
+def load_model():
+    # Raise on failure: st.cache_resource does not cache exceptions, so a
+    # missing/broken pickle is retried on the next rerun instead of pinning None.
+    import joblib
+
+    # The pickle is an uncompressed joblib dump, so its plain numeric arrays
+    # (calibrators, imputer stats; ~50 KB) are memory-mapped. The boosters are
+    # byte blobs and categories_ are object arrays, so the bulk of the 13 MB is
+    # still unpickled into memory — this is not a meaningful RSS saving.
+    model = joblib.load(MODEL_PATH, mmap_mode="r")
+    _pin_single_thread(model)
+    # Schema read once per process; the page rebinds it on each rerun
+    schema = (model_columns(model), model_text_columns(model))
+    _set_columns(*schema)
+
+    # Warm-up: one dummy row so the first user click doesn't pay the
+    # ColumnTransformer / booster first-call cost.
+    model.predict(make_frame(np.zeros((1, len(ALL_COLUMNS)), dtype=np.float32)))
+    return model, schema
+
+
+# ============ Input form ============
+# Invariant: widgets are rendered by walking ALL_COLUMNS linearly and each value
+# lands at COL_INDEX[col_name], so the row is already in the pipeline's
+# feature order — no input_df[ALL_COLUMNS] reindex is needed downstream.
+def get_user_input():
+    # Widgets read their value from state via key=, so no value= per rerun
+    for c in ALL_COLUMNS:
+        st.session_state.setdefault(c, DEFAULTS[c])
+
+    arr = np.empty((1, len(ALL_COLUMNS)), dtype=np.float32)
+    cols = st.columns(3)
+    for i, col_name in enumerate(ALL_COLUMNS):
+        kind = COLUMN_KIND[col_name]
+        with cols[i % 3]:
+            if kind == "yn":
+                val = st.radio(col_name, ["No", "Yes"], horizontal=True, key=col_name)
+                arr[0, COL_INDEX[col_name]] = 1 if val == "Yes" else 0
+            elif kind == "cycle":
+                # Dataset encoding: 2 = regular, 4 = irregular
+                val = st.radio(col_name, ["Regular", "Irregular"], horizontal=True, key=col_name)
+                arr[0, COL_INDEX[col_name]] = 2 if val == "Regular" else 4
+            elif kind == "blood":
+                val = st.selectbox(col_name, list(BLOOD_GROUP_CODES), key=col_name)
+                arr[0, COL_INDEX[col_name]] = BLOOD_GROUP_CODES[val]
+            elif kind == "hcg":
+                arr[0, COL_INDEX[col_name]] = st.number_input(
+                    col_name, min_value=0.0, step=0.01, format="%.2f", key=col_name)
+            elif kind == "int":
+                arr[0, COL_INDEX[col_name]] = st.number_input(col_name, step=1, format="%d", key=col_name)
+            else:
+                arr[0, COL_INDEX[col_name]] = st.number_input(
+                    col_name, step=0.1, format="%.2f", key=col_name)
+    return arr
+
+
+@st.fragment
+def patient_form(model):
+    # A submit reruns only this fragment, so predicting here leaves the rest
+    # of the page (and any uploaded batch) untouched.
+    with st.form("patient_form"):
+        input_arr = get_user_input()
+        pressed = st.form_submit_button("Predict")
+    if not pressed:
+        return
+
+    try:
+        input_df = make_frame(input_arr)
+        with busy(len(input_df)):
+            # One pass through the pipeline; class derived from the probabilities
+            try:
+                probability = model.predict_proba(input_df)[0]
+                prediction = int(np.argmax(probability))
+            except AttributeError:
+                prediction = model.predict(input_df)[0]
+                probability = None
+    except Exception as e:
+        st.error(f"Prediction failed: {e}")
+        return
+    show_result(prediction, probability)
+
+
+# ============ Batch input ============
+def read_batch(file):
+    """Read a multi-patient CSV into a frame in ALL_COLUMNS order.
+
+    Headers are stripped and extra columns (IDs, target) are ignored by usecols.
+    As in the notebook, non-numeric entries in numeric columns are coerced to
+    NaN for the imputer; TEXT_COLUMNS keep their raw strings (and NaN).
+    """
+    import pandas as pd
+
+    df = pd.read_csv(file, usecols=lambda c: c.strip() in COL_INDEX, dtype=str)
+    df.columns = df.columns.str.strip()
+    missing = [c for c in ALL_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+    df = df[list(ALL_COLUMNS)]
+    for c in ALL_COLUMNS:
+        if c not in TEXT_COLUMNS:
+            df[c] = pd.to_numeric(df[c], errors="coerce").astype(np.float32)
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def score_batch(data, _model):
+    """Read and score an uploaded CSV, cached on its bytes across reruns."""
+    batch_df = read_batch(io.BytesIO(data))
+    # One predict_proba call for all rows; column 0 = PCOS
+    probs = _model.predict_proba(batch_df)[:, 0]
+    results = batch_df.copy()
+    results.insert(0, "PCOS probability", probs)
+    results.insert(1, "Prediction", np.where(probs >= 0.5, "PCOS", "Healthy"))
+    return results
+
+
+def busy(n_rows):
+    """Spinner for large batches; a no-op context on the 1-row fast path."""
+    if n_rows > SPINNER_MIN_ROWS:
+        return st.spinner("Processing clinical parameters...")
+    return contextlib.nullcontext()
+
+
+def show_result(prediction, probability):
+    if int(prediction) == 0:
+        st.error("⚠️ High likelihood of PCOS")
+    else:
+        st.success("✅ Low likelihood of PCOS")
+    if probability is not None:
+        st.metric("PCOS probability", f"{probability[0]:.1%}")
+
+
+# ============ Page ============
+st.title("🩺 PCOS Clinical Screening")
+st.caption("Calibrated ensemble (XGB + LGBM + CatBoost). For research use only — not a diagnosis.")
+
+try:
+    model, schema = load_model()
+except FileNotFoundError:
+    st.error(f"Model file not found: {MODEL_PATH}")
+    model = None
+except Exception as e:
+    st.error(f"Failed to load model: {e}")
+    model = None
+
+if model:
+    # Track the model's own schema so a retrained pickle needs no code change
+    _set_columns(*schema)
+
+    batch_tab, single_tab = st.tabs(["Batch CSV", "Single patient"])
+
+    with batch_tab:
+        batch_file = st.file_uploader("Batch CSV", type="csv")
+        if batch_file is not None:
+            data = batch_file.getvalue()
+            try:
+                # Line count stands in for the row count to size the spinner
+                with busy(data.count(b"\n")):
+                    results = score_batch(data, model)
+            except Exception as e:
+                # No st.stop(): the single-patient tab must still render
+                st.error(f"Batch prediction failed: {e}")
+            else:
+                st.dataframe(results, use_container_width=True)
+
+    with single_tab:
+        patient_form(model)